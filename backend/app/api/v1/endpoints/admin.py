@@ -8,15 +8,12 @@ This module provides REST API endpoints for:
 - Dictionary validation and statistics
 """
 
-import asyncio
 import logging
-import os
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, BackgroundTasks, Query
-from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete, func
 from pydantic import BaseModel, Field
@@ -24,7 +21,7 @@ from pydantic import BaseModel, Field
 from ....services.stardict_service import stardict_service
 from ....models.proofreading import SanskritGlossaryEntry
 from ....core.database import get_db
-from ....core.auth import get_current_user, get_current_superuser
+from ....core.auth import get_current_superuser
 from ....models.user import User
 
 logger = logging.getLogger(__name__)
@@ -38,7 +35,7 @@ class StarDictImportRequest(BaseModel):
     dict_path: str = Field(..., description="Path to StarDict dictionary files")
     language: str = Field(default="sanskrit", description="Dictionary language")
     context: str = Field(default="imported", description="Import context/category")
-    batch_size: int = Field(default=100, ge=1, le=1000, description="Import batch size")
+    batch_size: int = Field(default=5000, ge=1, le=10000, description="Import batch size")
     validate_entries: bool = Field(default=True, description="Validate entries before import")
     deduplicate: bool = Field(default=True, description="Remove duplicate entries")
 
@@ -419,7 +416,7 @@ async def test_stardict_parser(
             "sample_entries": sample_entries,
             "parser_status": {
                 "ifo_parsed": bool(stardict_service.parser.info_data),
-                "idx_parsed": bool(stardict_service.parser.index_data),
+                "idx_parsed": bool(stardict_service.parser.idx_words),
                 "dict_parsed": bool(stardict_service.parser.dict_data),
                 "entries_extracted": len(entries) > 0
             },
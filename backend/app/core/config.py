@@ -42,6 +42,17 @@ class Settings(BaseSettings):
     # Elasticsearch
     ELASTICSEARCH_URL: str = "http://localhost:9200"
     ELASTICSEARCH_INDEX_PREFIX: str = "vangmayam"
+    ES_BULK_CHUNK_SIZE: int = 500  # Documents per _bulk request
+    ES_BULK_FLUSH_INTERVAL: float = 1.0  # Max seconds a queued document waits before flushing
+    ES_BULK_CONCURRENCY: int = 12  # Concurrent bulk flushers (queue holds two chunks per flusher)
+    ES_BULK_MAX_RETRIES: int = 3  # Retries for a queued batch before it goes to the fallback index
+    
+    # Kafka write-ahead buffer for search indexing (disabled unless a topic is set)
+    KAFKA_BOOTSTRAP_SERVERS: str = "localhost:9092"
+    KAFKA_INDEX_TOPIC: Optional[str] = None  # e.g. "vangmayam.index"
+    KAFKA_INDEX_GROUP: str = "vangmayam-indexer"
+    SEARCH_FALLBACK_INDEX_DIR: str = "cache/search_fallback"  # BM25 index used without Elasticsearch
+    SEARCH_ANALYZER_CACHE_SIZE: int = 50000  # Memoized normalized search queries
     
     # MinIO/S3 Storage
     MINIO_ENDPOINT: str = "localhost:9000"
@@ -60,6 +71,12 @@ class Settings(BaseSettings):
     TESSERACT_LANGUAGES: List[str] = ["san", "hin", "eng", "tam"]
     OCR_DPI: int = 400
     OCR_CONFIDENCE_THRESHOLD: float = 0.7
+    OCR_MAX_CONCURRENCY: int = 8  # Concurrent Vision API requests per batch
+    OCR_BATCH_MAX_BYTES: int = 7 * 1024 * 1024  # Inline image bytes per Vision request (10 MB JSON cap, base64 adds a third)
+    OCR_RATE_LIMIT_BURST: int = 16  # Vision API token-bucket capacity (images)
+    OCR_RATE_LIMIT_PER_SECOND: float = 10.0  # Vision API sustained images per second
+    OCR_CACHE_DIR: str = "cache/ocr"  # Content-addressed cache of Vision results
+    OCR_MAX_RETRIES: int = 5  # Vision API attempts on quota/transient errors
     
     # Google Vision API
     GOOGLE_CLOUD_PROJECT: Optional[str] = None
@@ -8,6 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
+import asyncio
 import time
 import uuid
 
@@ -16,6 +17,9 @@ from app.core.database import init_db
 from app.core.health import wait_for_database
 from app.core.logging import setup_logging
 from app.api.v1.api import api_router
+from app.services.google_auth_service import google_auth_service
+from app.services.search_service import search_service
+from app.services.stardict_service import stardict_service
 
 # Setup logging
 logger = setup_logging()
@@ -39,10 +43,20 @@ async def lifespan(app: FastAPI):
     await init_db()
     logger.info("✅ Database initialized successfully")
     
+    # Warm DNS/TLS to Google OAuth in the background so the first login skips the handshake
+    warmup_task = None
+    if google_auth_service.config.is_configured():
+        warmup_task = asyncio.create_task(google_auth_service.warm_up())
+    
     yield
     
     # Shutdown
     logger.info("🙏 Shutting down Vāṇmayam gracefully")
+    if warmup_task and not warmup_task.done():
+        warmup_task.cancel()
+    await google_auth_service.close()
+    await search_service.close()  # Flushes documents still queued for indexing
+    stardict_service.close()  # Stops the dictionary extraction process pool
 
 
 # Create FastAPI application
@@ -12,11 +12,12 @@ This module provides comprehensive Google OAuth 2.0 authentication including:
 import asyncio
 import logging
 import secrets
-import json
 from typing import Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
-from urllib.parse import urlencode, parse_qs
+from urllib.parse import urlencode
 import aiohttp
+import fastjsonschema
+import orjson
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -25,7 +26,6 @@ from sqlalchemy import select
 from pydantic import BaseModel
 
 from ..models.user import User, UserRole
-from ..core.database import get_db
 from ..core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -74,6 +74,24 @@ class GoogleUserInfo(BaseModel):
     locale: Optional[str] = None
 
 
+# Userinfo payloads have a fixed shape, so the validator is compiled once at
+# import and the model is then built with model_construct (no re-validation).
+_VALIDATE_USERINFO = fastjsonschema.compile({
+    "type": "object",
+    "properties": {
+        "id": {"type": "string"},
+        "email": {"type": "string"},
+        "verified_email": {"type": "boolean"},
+        "name": {"type": "string"},
+        "given_name": {"type": ["string", "null"]},
+        "family_name": {"type": ["string", "null"]},
+        "picture": {"type": ["string", "null"]},
+        "locale": {"type": ["string", "null"]}
+    },
+    "required": ["id", "email", "verified_email", "name"]
+})
+
+
 class AuthTokens(BaseModel):
     """Authentication tokens model"""
     access_token: str
@@ -90,6 +108,37 @@ class GoogleAuthService:
     def __init__(self):
         self.config = GoogleAuthConfig()
         self.session_store = {}  # In-memory session store (use Redis in production)
+        self._http: Optional[aiohttp.ClientSession] = None  # Shared so warmed connections are reused
+    
+    def _get_http(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session, creating it on first use
+        """
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession()
+        return self._http
+    
+    async def warm_up(self) -> None:
+        """
+        Pre-establish DNS, TLS and the HTTP connection to the userinfo endpoint
+        so the first real login skips the handshake
+        """
+        try:
+            session = self._get_http()
+            headers = {'Authorization': 'Bearer invalid'}
+            async with session.get(self.config.userinfo_uri, headers=headers) as response:
+                await response.read()
+            logger.info("✅ Warmed up Google OAuth connection")
+        except Exception as e:
+            logger.warning(f"⚠️ Google OAuth connection warm-up failed: {e}")
+    
+    async def close(self) -> None:
+        """
+        Close the shared HTTP session
+        """
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
     
     def generate_auth_url(self, state: Optional[str] = None) -> Tuple[str, str]:
         """
@@ -178,14 +227,14 @@ class GoogleAuthService:
             }
             
             # Exchange code for tokens
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.config.token_uri, data=data) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"❌ Token exchange failed: {response.status} - {error_text}")
-                        raise ValueError(f"Token exchange failed: {response.status}")
-                    
-                    tokens = await response.json()
+            session = self._get_http()
+            async with session.post(self.config.token_uri, data=data) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"❌ Token exchange failed: {response.status} - {error_text}")
+                    raise ValueError(f"Token exchange failed: {response.status}")
+                
+                tokens = await response.json()
             
             logger.info("✅ Successfully exchanged code for tokens")
             return tokens
@@ -203,16 +252,18 @@ class GoogleAuthService:
                 'Authorization': f'Bearer {access_token}'
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.config.userinfo_uri, headers=headers) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"❌ User info request failed: {response.status} - {error_text}")
-                        raise ValueError(f"User info request failed: {response.status}")
-                    
-                    user_data = await response.json()
+            session = self._get_http()
+            async with session.get(self.config.userinfo_uri, headers=headers) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"❌ User info request failed: {response.status} - {error_text}")
+                    raise ValueError(f"User info request failed: {response.status}")
+                
+                body = await response.read()
             
-            user_info = GoogleUserInfo(**user_data)
+            user_data = orjson.loads(body)
+            _VALIDATE_USERINFO(user_data)
+            user_info = GoogleUserInfo.model_construct(**user_data)
             logger.info(f"✅ Retrieved user info for: {user_info.email}")
             return user_info
             
@@ -220,9 +271,17 @@ class GoogleAuthService:
             logger.error(f"❌ Error getting user info: {e}")
             raise
     
-    async def create_or_update_user(self, user_info: GoogleUserInfo, db: AsyncSession) -> User:
+    async def create_or_update_user(
+        self,
+        user_info: GoogleUserInfo,
+        db: AsyncSession,
+        refresh: bool = True
+    ) -> User:
         """
         Create or update user based on Google user info
+        
+        With refresh=False the caller is responsible for refreshing the user,
+        which lets it overlap other work with that round-trip.
         """
         try:
             # Check if user exists
@@ -267,7 +326,8 @@ class GoogleAuthService:
                     logger.info(f"✅ Created new user: {user_info.email}")
             
             await db.commit()
-            await db.refresh(user)
+            if refresh:
+                await db.refresh(user)
             
             return user
             
@@ -339,17 +399,21 @@ class GoogleAuthService:
             # Get user information
             user_info = await self.get_user_info(access_token)
             
-            # Create or update user
-            user = await self.create_or_update_user(user_info, db)
+            # Create or update user (committed; refresh is overlapped below)
+            user = await self.create_or_update_user(user_info, db, refresh=False)
             
-            # Create JWT tokens
+            # Create JWT tokens - sign in a worker thread while the refresh is in flight
             token_data = {
                 "sub": str(user.id),
                 "email": user.email,
                 "role": user.role.value
             }
             
-            jwt_token = self.create_access_token(token_data)
+            jwt_task = asyncio.create_task(asyncio.to_thread(self.create_access_token, token_data))
+            try:
+                await db.refresh(user)
+            finally:
+                jwt_token = await jwt_task
             
             auth_tokens = AuthTokens(
                 access_token=jwt_token,
@@ -10,36 +10,230 @@ This service handles:
 """
 
 import asyncio
+import functools
+import hashlib
 import logging
+import random
+import re
+import time
 from typing import List, Optional, Dict, Any, Tuple
 from pathlib import Path
-import json
+import os
 from datetime import datetime
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
-import base64
+from xml.sax.saxutils import XMLGenerator
+from xml.sax.xmlreader import AttributesImpl
+
+import aiofiles
+import orjson
 
 # Google Cloud Vision
 try:
     from google.cloud import vision
     from google.oauth2 import service_account
+    from google.api_core import exceptions as google_exceptions
     VISION_AVAILABLE = True
+    
+    # Transient errors worth retrying (quota, overload, timeouts)
+    _RETRYABLE_ERRORS = (
+        google_exceptions.ResourceExhausted,
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.DeadlineExceeded,
+    )
 except ImportError:
     VISION_AVAILABLE = False
+    _RETRYABLE_ERRORS = ()
     logging.warning("Google Cloud Vision not available - OCR processing disabled")
 
 from ..core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Script detection patterns (scanned by the regex engine rather than a Python loop)
+_DEVANAGARI_RE = re.compile(r'[\u0900-\u097F]')
+_LATIN_RE = re.compile(r'[A-Za-z]')
+
+
+class AsyncTokenBucket:
+    """Token-bucket rate limiter shared by concurrent OCR requests"""
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate  # Tokens added per second
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+    
+    async def acquire(self, tokens: float = 1.0):
+        """
+        Wait until `tokens` are available and consume them
+        
+        Requests larger than the burst capacity are charged in capacity-sized
+        steps, so a big batch still pays for every image it sends.
+        """
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            while tokens > 0:
+                step = min(tokens, self.capacity)
+                self._refill()
+                while self.tokens < step:
+                    await asyncio.sleep((step - self.tokens) / self.refill_rate)
+                    self._refill()
+                self.tokens -= step
+                tokens -= step
+    
+    def drain(self):
+        """Empty the bucket so every waiter backs off (e.g. after a quota error)"""
+        self._refill()
+        self.tokens = 0.0
+
+
+def _build_alto(ocr_result: Dict[str, Any], output_path: str, alto_namespace: Dict[str, str]):
+    """
+    Stream OCR results to an ALTO XML file
+    
+    Runs on the default thread executor: streaming the XML to disk is I/O-bound,
+    and threads avoid forking alongside the gRPC Vision client or pickling the
+    OCR result per page.
+    """
+    output_path = Path(output_path)
+    
+    # Page dimensions as reported by Vision
+    page_width = ocr_result.get("page_width", 0)
+    page_height = ocr_result.get("page_height", 0)
+    
+    processed_at = ocr_result.get("processed_at", datetime.utcnow().isoformat())
+    
+    # Create output directory if needed
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Stream elements straight to the file so the document is never held in memory
+    with open(output_path, 'w', encoding='utf-8') as f:
+        gen = XMLGenerator(f, 'utf-8', short_empty_elements=True)
+        
+        def open_tag(name: str, depth: int, attrs: Optional[Dict[str, str]] = None):
+            if depth:
+                gen.ignorableWhitespace('\n' + '  ' * depth)
+            gen.startElement(name, AttributesImpl(attrs or {}))
+        
+        def close_tag(name: str, depth: int):
+            gen.ignorableWhitespace('\n' + '  ' * depth)
+            gen.endElement(name)
+        
+        def leaf(name: str, depth: int, attrs: Optional[Dict[str, str]] = None, text: str = ""):
+            open_tag(name, depth, attrs)
+            if text:
+                gen.characters(text)
+            gen.endElement(name)
+        
+        def bbox_attrs(bbox: Dict[str, int]) -> Dict[str, str]:
+            return {
+                "HPOS": str(bbox.get("x_min", 0)),
+                "VPOS": str(bbox.get("y_min", 0)),
+                "WIDTH": str(bbox.get("width", 0)),
+                "HEIGHT": str(bbox.get("height", 0))
+            }
+        
+        gen.startDocument()
+        open_tag("alto", 0, {
+            "xmlns": alto_namespace["alto"],
+            "xmlns:xsi": alto_namespace["xsi"],
+            "xsi:schemaLocation": "http://www.loc.gov/standards/alto/ns-v4# "
+                                  "http://www.loc.gov/standards/alto/v4/alto-4-2.xsd"
+        })
+        
+        # Description section
+        open_tag("Description", 1)
+        leaf("MeasurementUnit", 2, text="pixel")
+        open_tag("sourceImageInformation", 2)
+        leaf("fileName", 3, text=Path(ocr_result["image_path"]).name)
+        close_tag("sourceImageInformation", 2)
+        open_tag("OCRProcessing", 2, {"ID": "OCR_1"})
+        open_tag("ocrProcessingStep", 3)
+        open_tag("processingSoftware", 4)
+        leaf("softwareCreator", 5, text="Google Cloud Vision API")
+        leaf("softwareName", 5, text="Google Vision OCR")
+        close_tag("processingSoftware", 4)
+        leaf("processingDateTime", 4, text=processed_at)
+        close_tag("ocrProcessingStep", 3)
+        close_tag("OCRProcessing", 2)
+        close_tag("Description", 1)
+        
+        # Layout section, page and print space (main content area)
+        open_tag("Layout", 1)
+        open_tag("Page", 2, {
+            "ID": "PAGE_1",
+            "PHYSICAL_IMG_NR": "1",
+            "WIDTH": str(page_width),
+            "HEIGHT": str(page_height)
+        })
+        open_tag("PrintSpace", 3, {
+            "HPOS": "0",
+            "VPOS": "0",
+            "WIDTH": str(page_width),
+            "HEIGHT": str(page_height)
+        })
+        
+        # Process blocks
+        for block_idx, block in enumerate(ocr_result.get("blocks", []), 1):
+            open_tag("TextBlock", 4, {
+                "ID": f"BLOCK_{block_idx}",
+                **bbox_attrs(block.get("bounding_box", {}))
+            })
+            
+            # Process paragraphs
+            for para_idx, paragraph in enumerate(block.get("paragraphs", []), 1):
+                open_tag("TextLine", 5, {
+                    "ID": f"LINE_{block_idx}_{para_idx}",
+                    **bbox_attrs(paragraph.get("bounding_box", {}))
+                })
+                
+                # Process words
+                words = paragraph.get("words", [])
+                last_word_idx = len(words)
+                for word_idx, word in enumerate(words, 1):
+                    leaf("String", 6, {
+                        "ID": f"WORD_{block_idx}_{para_idx}_{word_idx}",
+                        "CONTENT": word.get("text", ""),
+                        "WC": f"{word.get('confidence', 0.0):.3f}",
+                        **bbox_attrs(word.get("bounding_box", {}))
+                    })
+                    
+                    # Add space element between words (except last word)
+                    if word_idx < last_word_idx:
+                        leaf("SP", 6, {"WIDTH": "5"})  # Approximate space width
+                
+                close_tag("TextLine", 5)
+            
+            close_tag("TextBlock", 4)
+        
+        close_tag("PrintSpace", 3)
+        close_tag("Page", 2)
+        close_tag("Layout", 1)
+        close_tag("alto", 0)
+        gen.endDocument()
+        f.write('\n')
+
 
 class GoogleVisionOCRService:
     """Service for OCR processing using Google Cloud Vision API"""
     
-    def __init__(self, credentials_path: Optional[Path] = None):
+    def __init__(self, credentials_path: Optional[Path] = None, cache_dir: Optional[Path] = None):
         self.credentials_path = credentials_path
+        self.cache_dir = cache_dir or Path(settings.OCR_CACHE_DIR)
         self.client: Optional[vision.ImageAnnotatorClient] = None
-        self.rate_limit_delay = 1.0  # Seconds between API calls
+        self.rate_limiter = AsyncTokenBucket(
+            capacity=settings.OCR_RATE_LIMIT_BURST,
+            refill_rate=settings.OCR_RATE_LIMIT_PER_SECOND
+        )
+        self.max_concurrency = settings.OCR_MAX_CONCURRENCY  # Concurrent OCR requests per batch
+        self.vision_batch_size = 16  # Max images per BatchAnnotateImages call
+        self.vision_batch_max_bytes = settings.OCR_BATCH_MAX_BYTES  # Inline image bytes per call
+        self.max_retries = settings.OCR_MAX_RETRIES  # Attempts per Vision call on transient errors
         
         # ALTO XML namespace and schema info
         self.alto_namespace = {
@@ -82,7 +276,9 @@ class GoogleVisionOCRService:
         self,
         image_path: Path,
         language_hints: Optional[List[str]] = None,
-        options: Optional[Dict[str, Any]] = None
+        options: Optional[Dict[str, Any]] = None,
+        image_context: Optional[vision.ImageContext] = None,
+        processed_at: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Process a single image with Google Vision OCR
@@ -91,71 +287,315 @@ class GoogleVisionOCRService:
             image_path: Path to image file
             language_hints: List of language codes (e.g., ['sa', 'en'] for Sanskrit and English)
             options: Additional OCR options
+            image_context: Prebuilt image context for language_hints (built if omitted)
+            processed_at: Shared batch timestamp (taken now if omitted)
             
         Returns:
             OCR results with text, confidence, and bounding boxes
         """
+        processed_at = processed_at or datetime.utcnow().isoformat()
+        
         try:
-            if not self.client:
-                await self.initialize_client()
-            
             logger.info(f"🔍 Processing OCR for: {image_path.name}")
             
-            # Read image file
-            with open(image_path, 'rb') as image_file:
-                content = image_file.read()
-            
-            # Create Vision API image object
-            image = vision.Image(content=content)
+            image, key_material = await self._load_image(image_path)
             
-            # Configure OCR features
-            features = [vision.Feature(type_=vision.Feature.Type.DOCUMENT_TEXT_DETECTION)]
+            # Identical image + settings already processed: skip the Vision call
+            cache_key = self._cache_key(key_material, language_hints, options)
+            cached = await self._load_cached_result(cache_key, image_path)
+            if cached:
+                return cached
             
-            # Set up image context with language hints
-            image_context = vision.ImageContext()
-            if language_hints:
-                image_context.language_hints = language_hints
+            if not self.client:
+                await self.initialize_client()
             
-            # Create request
-            request = vision.AnnotateImageRequest(
-                image=image,
-                features=features,
-                image_context=image_context
-            )
+            if image_context is None:
+                image_context = self._build_image_context(language_hints)
+            request = self._build_request(image, image_context)
             
             # Make API call
-            response = await asyncio.get_event_loop().run_in_executor(
-                None, self.client.annotate_image, request
+            response = await self._call_vision(
+                functools.partial(self.client.annotate_image, request)
             )
             
             if response.error.message:
                 raise Exception(f"Vision API error: {response.error.message}")
             
-            # Process response
-            result = await self._process_vision_response(response, image_path, options or {})
-            
-            # Add rate limiting delay
-            await asyncio.sleep(self.rate_limit_delay)
+            # Process response (CPU-bound walk, so keep it off the event loop)
+            result = await asyncio.get_event_loop().run_in_executor(
+                None, self._process_vision_response, response, image_path, options or {}, processed_at
+            )
+            await self._store_cached_result(cache_key, result)
             
-            logger.info(f"✅ OCR completed for {image_path.name}: {len(result.get('words', []))} words detected")
+            logger.info(f"✅ OCR completed for {image_path.name}: {result.get('word_count', 0)} words detected")
             return result
             
         except Exception as e:
             logger.error(f"❌ OCR processing failed for {image_path}: {e}")
-            return {
-                "image_path": str(image_path),
-                "error": str(e),
-                "status": "failed",
-                "processed_at": datetime.utcnow().isoformat()
-            }
+            return self._failed_result(image_path, e, processed_at)
+    
+    async def _call_vision(self, call: functools.partial, cost: int = 1):
+        """
+        Run a blocking Vision API call under the rate limiter
+        
+        Quota, overload and timeout errors are retried with exponential backoff and
+        jitter; a quota error also drains the token bucket so concurrent requests
+        slow down together instead of each hitting the limit.
+        """
+        loop = asyncio.get_event_loop()
+        
+        for attempt in range(self.max_retries):
+            await self.rate_limiter.acquire(cost)
+            try:
+                return await loop.run_in_executor(None, call)
+            except _RETRYABLE_ERRORS as e:
+                if attempt == self.max_retries - 1:
+                    raise
+                
+                if isinstance(e, google_exceptions.ResourceExhausted):
+                    self.rate_limiter.drain()
+                
+                delay = min(64.0, 0.5 * (2 ** attempt)) + random.random() * 0.25
+                logger.warning(
+                    f"⚠️ Vision API {type(e).__name__}, retrying in {delay:.1f}s "
+                    f"(attempt {attempt + 1}/{self.max_retries})"
+                )
+                await asyncio.sleep(delay)
+    
+    async def _read_image(self, image_path: Path) -> bytes:
+        """Read image file contents without blocking the event loop"""
+        async with aiofiles.open(image_path, 'rb') as image_file:
+            return await image_file.read()
+    
+    def _gcs_uri(self, image_path: Path) -> Optional[str]:
+        """Return the gs:// URI if the image lives in Cloud Storage"""
+        path_str = str(image_path)
+        if path_str.startswith("gs://"):
+            return path_str
+        # Path() collapses the double slash of "gs://bucket/..."
+        if path_str.startswith("gs:/"):
+            return "gs://" + path_str[len("gs:/"):]
+        return None
+    
+    async def _load_image(self, image_path: Path) -> Tuple[vision.Image, Optional[bytes]]:
+        """
+        Create the Vision API image object for a path
+        
+        Cloud Storage images are referenced by URI so Vision fetches them directly
+        instead of us downloading and re-uploading the bytes.
+        
+        Returns:
+            The image and its content for the cache key; None for GCS images, whose
+            content is never read here (an object overwritten at the same URI must
+            not be served a stale result), so they are not cached
+        """
+        gcs_uri = self._gcs_uri(image_path)
+        if gcs_uri:
+            image = vision.Image(source=vision.ImageSource(image_uri=gcs_uri))
+            return image, None
+        
+        content = await self._read_image(image_path)
+        return vision.Image(content=content), content
+    
+    def _build_image_context(self, language_hints: Optional[List[str]] = None) -> vision.ImageContext:
+        """Set up image context with language hints (shareable across a batch)"""
+        if language_hints:
+            return vision.ImageContext(language_hints=language_hints)
+        return vision.ImageContext()
     
-    async def _process_vision_response(
+    def _build_request(
+        self,
+        image: vision.Image,
+        image_context: vision.ImageContext
+    ) -> vision.AnnotateImageRequest:
+        """Build a DOCUMENT_TEXT_DETECTION request for one image"""
+        # Configure OCR features
+        features = [vision.Feature(type_=vision.Feature.Type.DOCUMENT_TEXT_DETECTION)]
+        
+        # Create request
+        return vision.AnnotateImageRequest(
+            image=image,
+            features=features,
+            image_context=image_context
+        )
+    
+    def _cache_key(
+        self,
+        content: Optional[bytes],
+        language_hints: Optional[List[str]] = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """Cache key covering the image bytes and every setting that affects the result"""
+        if content is None:
+            return None
+        
+        key = hashlib.sha256(content)
+        key.update(":".join(language_hints or []).encode("utf-8"))
+        key.update(orjson.dumps(options or {}, option=orjson.OPT_SORT_KEYS, default=str))
+        return key.hexdigest()
+    
+    async def _load_cached_result(self, cache_key: Optional[str], image_path: Path) -> Optional[Dict[str, Any]]:
+        """Return the cached OCR result for a key, or None on a miss"""
+        if cache_key is None:
+            return None
+        
+        cache_file = self.cache_dir / f"{cache_key}.json"
+        try:
+            async with aiofiles.open(cache_file, 'rb') as f:
+                result = orjson.loads(await f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable OCR cache entry {cache_file.name}: {e}")
+            return None
+        
+        # Same content may arrive under a different file name
+        result["image_path"] = str(image_path)
+        logger.info(f"♻️ OCR cache hit for {image_path.name}")
+        return result
+    
+    async def _store_cached_result(self, cache_key: Optional[str], result: Dict[str, Any]):
+        """Persist a successful OCR result under its cache key"""
+        if cache_key is None:
+            return
+        
+        try:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(
+                None, functools.partial(self.cache_dir.mkdir, parents=True, exist_ok=True)
+            )
+            cache_file = self.cache_dir / f"{cache_key}.json"
+            
+            # Write then rename so concurrent readers never see a partial file
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            async with aiofiles.open(tmp_file, 'wb') as f:
+                await f.write(orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS))
+            await loop.run_in_executor(None, os.replace, tmp_file, cache_file)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to write OCR cache entry: {e}")
+    
+    def clear_cache(self) -> int:
+        """
+        Remove all cached OCR results
+        
+        Returns:
+            Number of cache entries removed
+        """
+        removed = 0
+        if self.cache_dir.exists():
+            for cache_file in self.cache_dir.glob("*.json"):
+                cache_file.unlink(missing_ok=True)
+                removed += 1
+        
+        logger.info(f"🧹 Cleared {removed} OCR cache entries")
+        return removed
+    
+    def _failed_result(
+        self,
+        image_path: Path,
+        error: Exception,
+        processed_at: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the result returned for an image that could not be processed"""
+        return {
+            "image_path": str(image_path),
+            "error": str(error),
+            "status": "failed",
+            "processed_at": processed_at or datetime.utcnow().isoformat()
+        }
+    
+    async def _batch_annotate(
+        self,
+        image_paths: List[Path],
+        language_hints: Optional[List[str]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        image_context: Optional[vision.ImageContext] = None,
+        processed_at: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Process up to vision_batch_size images with a single BatchAnnotateImages call
+        
+        Returns one result per input path, in the same order.
+        """
+        processed_at = processed_at or datetime.utcnow().isoformat()
+        
+        if len(image_paths) == 1:
+            return [await self.process_image_ocr(
+                image_paths[0], language_hints, options, image_context, processed_at
+            )]
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(image_paths)
+        cache_keys: List[Optional[str]] = [None] * len(image_paths)
+        
+        try:
+            if image_context is None:
+                image_context = self._build_image_context(language_hints)
+            
+            # Build requests for cache misses, recording unreadable images as failures up front
+            request_indices = []
+            requests = []
+            for i, image_path in enumerate(image_paths):
+                try:
+                    image, key_material = await self._load_image(image_path)
+                    cache_keys[i] = self._cache_key(key_material, language_hints, options)
+                    results[i] = await self._load_cached_result(cache_keys[i], image_path)
+                    if results[i] is None:
+                        requests.append(self._build_request(image, image_context))
+                        request_indices.append(i)
+                except Exception as e:
+                    logger.error(f"❌ OCR processing failed for {image_path}: {e}")
+                    results[i] = self._failed_result(image_path, e, processed_at)
+            
+            if requests:
+                if not self.client:
+                    await self.initialize_client()
+                
+                logger.info(f"🔍 Processing OCR batch of {len(requests)} images")
+                
+                # Make API call (quota is counted per image)
+                response = await self._call_vision(
+                    functools.partial(self.client.batch_annotate_images, requests=requests),
+                    cost=len(requests)
+                )
+                
+                # Responses are aligned with the requests
+                for i, image_response in zip(request_indices, response.responses):
+                    image_path = image_paths[i]
+                    try:
+                        if image_response.error.message:
+                            raise Exception(f"Vision API error: {image_response.error.message}")
+                        
+                        results[i] = await asyncio.get_event_loop().run_in_executor(
+                            None, self._process_vision_response, image_response, image_path,
+                            options or {}, processed_at
+                        )
+                        await self._store_cached_result(cache_keys[i], results[i])
+                        logger.info(f"✅ OCR completed for {image_path.name}: {results[i].get('word_count', 0)} words detected")
+                    except Exception as e:
+                        logger.error(f"❌ OCR processing failed for {image_path}: {e}")
+                        results[i] = self._failed_result(image_path, e, processed_at)
+            
+        except Exception as e:
+            logger.error(f"❌ OCR batch request failed: {e}")
+            for i, image_path in enumerate(image_paths):
+                if results[i] is None:
+                    results[i] = self._failed_result(image_path, e, processed_at)
+        
+        return results
+    
+    def _process_vision_response(
         self,
         response: vision.AnnotateImageResponse,
         image_path: Path,
-        options: Dict[str, Any]
+        options: Dict[str, Any],
+        processed_at: str
     ) -> Dict[str, Any]:
-        """Process Google Vision API response into structured format"""
+        """
+        Process Google Vision API response into structured format
+        
+        Pure CPU work; callers run it in an executor so concurrent requests keep flowing.
+        processed_at is supplied by the caller so a batch shares one timestamp.
+        """
         try:
             # Get full text annotation
             full_text = response.full_text_annotation
@@ -165,87 +605,95 @@ class GoogleVisionOCRService:
                     "image_path": str(image_path),
                     "text": "",
                     "confidence": 0.0,
-                    "words": [],
-                    "lines": [],
                     "paragraphs": [],
                     "blocks": [],
                     "status": "no_text_detected",
-                    "processed_at": datetime.utcnow().isoformat()
+                    "word_count": 0,
+                    "processed_at": processed_at
                 }
             
             # Extract text content
             detected_text = full_text.text
             
-            # Process text structure
-            words = []
-            lines = []
+            # Process text structure (words live only under their paragraph)
+            word_count = 0
+            confidence_sum = 0.0
+            confidence_count = 0
             paragraphs = []
             blocks = []
             
-            for page in full_text.pages:
+            # Proto field access is slow; bind hot lookups to locals once
+            extract_bounding_box = self._extract_bounding_box
+            pages = full_text.pages
+            
+            # Vision reports the page size directly (pages hold one image each)
+            page_width = pages[0].width if pages else 0
+            page_height = pages[0].height if pages else 0
+            
+            for page in pages:
                 for block in page.blocks:
-                    block_info = {
-                        "block_type": block.block_type.name,
-                        "confidence": block.confidence,
-                        "bounding_box": self._extract_bounding_box(block.bounding_box),
-                        "paragraphs": []
-                    }
+                    block_paragraphs = []
                     
                     for paragraph in block.paragraphs:
-                        paragraph_info = {
-                            "confidence": paragraph.confidence,
-                            "bounding_box": self._extract_bounding_box(paragraph.bounding_box),
-                            "words": []
-                        }
-                        
-                        paragraph_text = ""
+                        words = []
                         
                         for word in paragraph.words:
-                            word_text = "".join([symbol.text for symbol in word.symbols])
+                            # Each symbol's text is read from the proto once and reused for the word text
+                            symbols = list(word.symbols)
+                            symbol_texts = [symbol.text for symbol in symbols]
                             word_confidence = word.confidence
                             
-                            word_info = {
-                                "text": word_text,
+                            words.append({
+                                "text": "".join(symbol_texts),
                                 "confidence": word_confidence,
-                                "bounding_box": self._extract_bounding_box(word.bounding_box),
-                                "symbols": []
-                            }
-                            
-                            # Extract symbol-level information
-                            for symbol in word.symbols:
-                                symbol_info = {
-                                    "text": symbol.text,
-                                    "confidence": symbol.confidence,
-                                    "bounding_box": self._extract_bounding_box(symbol.bounding_box)
-                                }
-                                word_info["symbols"].append(symbol_info)
+                                "bounding_box": extract_bounding_box(word.bounding_box),
+                                # Extract symbol-level information
+                                "symbols": [
+                                    {
+                                        "text": symbol_text,
+                                        "confidence": symbol.confidence,
+                                        "bounding_box": extract_bounding_box(symbol.bounding_box)
+                                    }
+                                    for symbol_text, symbol in zip(symbol_texts, symbols)
+                                ]
+                            })
                             
-                            words.append(word_info)
-                            paragraph_info["words"].append(word_info)
-                            paragraph_text += word_text + " "
+                            if word_confidence > 0:
+                                confidence_sum += word_confidence
+                                confidence_count += 1
+                        
+                        word_count += len(words)
                         
-                        paragraph_info["text"] = paragraph_text.strip()
-                        paragraphs.append(paragraph_info)
-                        block_info["paragraphs"].append(paragraph_info)
+                        block_paragraphs.append({
+                            "confidence": paragraph.confidence,
+                            "bounding_box": extract_bounding_box(paragraph.bounding_box),
+                            "words": words,
+                            "text": " ".join([w["text"] for w in words]).strip()
+                        })
                     
-                    blocks.append(block_info)
+                    paragraphs += block_paragraphs
+                    blocks.append({
+                        "block_type": block.block_type.name,
+                        "confidence": block.confidence,
+                        "bounding_box": extract_bounding_box(block.bounding_box),
+                        "paragraphs": block_paragraphs
+                    })
             
             # Calculate overall confidence
-            word_confidences = [w["confidence"] for w in words if w["confidence"] > 0]
-            overall_confidence = sum(word_confidences) / len(word_confidences) if word_confidences else 0.0
+            overall_confidence = confidence_sum / confidence_count if confidence_count else 0.0
             
             result = {
                 "image_path": str(image_path),
                 "text": detected_text,
                 "confidence": overall_confidence,
-                "words": words,
-                "lines": lines,  # Lines can be extracted from paragraphs if needed
+                "page_width": page_width,
+                "page_height": page_height,
                 "paragraphs": paragraphs,
                 "blocks": blocks,
                 "language_detected": self._detect_languages(detected_text),
                 "status": "success",
-                "processed_at": datetime.utcnow().isoformat(),
-                "word_count": len(words),
+                "processed_at": processed_at,
+                "word_count": word_count,
                 "character_count": len(detected_text)
             }
             
@@ -257,14 +705,34 @@ class GoogleVisionOCRService:
     
     def _extract_bounding_box(self, bounding_box) -> Dict[str, int]:
         """Extract bounding box coordinates"""
-        vertices = bounding_box.vertices
+        vertices = iter(bounding_box.vertices)
+        
+        # Single pass with running min/max (each vertex attribute is read once)
+        first = next(vertices, None)
+        if first is None:
+            return {"x_min": 0, "y_min": 0, "x_max": 0, "y_max": 0, "width": 0, "height": 0}
+        
+        x_min = x_max = first.x
+        y_min = y_max = first.y
+        for v in vertices:
+            x = v.x
+            y = v.y
+            if x < x_min:
+                x_min = x
+            elif x > x_max:
+                x_max = x
+            if y < y_min:
+                y_min = y
+            elif y > y_max:
+                y_max = y
+        
         return {
-            "x_min": min(v.x for v in vertices),
-            "y_min": min(v.y for v in vertices),
-            "x_max": max(v.x for v in vertices),
-            "y_max": max(v.y for v in vertices),
-            "width": max(v.x for v in vertices) - min(v.x for v in vertices),
-            "height": max(v.y for v in vertices) - min(v.y for v in vertices)
+            "x_min": x_min,
+            "y_min": y_min,
+            "x_max": x_max,
+            "y_max": y_max,
+            "width": x_max - x_min,
+            "height": y_max - y_min
         }
     
     def _detect_languages(self, text: str) -> List[str]:
@@ -272,11 +740,11 @@ class GoogleVisionOCRService:
         languages = []
         
         # Check for Sanskrit/Devanagari characters
-        if any('\u0900' <= char <= '\u097F' for char in text):
+        if _DEVANAGARI_RE.search(text):
             languages.append("sanskrit")
         
         # Check for English characters
-        if any('a' <= char.lower() <= 'z' for char in text):
+        if _LATIN_RE.search(text):
             languages.append("english")
         
         return languages or ["unknown"]
@@ -301,113 +769,10 @@ class GoogleVisionOCRService:
         try:
             logger.info(f"📄 Converting OCR results to ALTO XML: {output_path.name}")
             
-            # Create ALTO XML structure
-            alto_root = ET.Element("alto")
-            alto_root.set("xmlns", self.alto_namespace["alto"])
-            alto_root.set("xmlns:xsi", self.alto_namespace["xsi"])
-            alto_root.set("xsi:schemaLocation", 
-                         "http://www.loc.gov/standards/alto/ns-v4# http://www.loc.gov/standards/alto/v4/alto-4-2.xsd")
-            
-            # Description section
-            description = ET.SubElement(alto_root, "Description")
-            
-            # Measurement unit
-            measurement_unit = ET.SubElement(description, "MeasurementUnit")
-            measurement_unit.text = "pixel"
-            
-            # Source image information
-            source_image_info = ET.SubElement(description, "sourceImageInformation")
-            file_name = ET.SubElement(source_image_info, "fileName")
-            file_name.text = Path(ocr_result["image_path"]).name
-            
-            # OCR processing information
-            ocr_processing = ET.SubElement(description, "OCRProcessing")
-            ocr_processing.set("ID", "OCR_1")
-            
-            ocr_software = ET.SubElement(ocr_processing, "ocrProcessingStep")
-            processing_software = ET.SubElement(ocr_software, "processingSoftware")
-            software_creator = ET.SubElement(processing_software, "softwareCreator")
-            software_creator.text = "Google Cloud Vision API"
-            software_name = ET.SubElement(processing_software, "softwareName")
-            software_name.text = "Google Vision OCR"
-            processing_date = ET.SubElement(ocr_software, "processingDateTime")
-            processing_date.text = ocr_result.get("processed_at", datetime.utcnow().isoformat())
-            
-            # Layout section
-            layout = ET.SubElement(alto_root, "Layout")
-            
-            # Page
-            page = ET.SubElement(layout, "Page")
-            page.set("ID", "PAGE_1")
-            page.set("PHYSICAL_IMG_NR", "1")
-            
-            # Get image dimensions (approximate from bounding boxes)
-            max_x = max_y = 0
-            for block in ocr_result.get("blocks", []):
-                bbox = block.get("bounding_box", {})
-                max_x = max(max_x, bbox.get("x_max", 0))
-                max_y = max(max_y, bbox.get("y_max", 0))
-            
-            page.set("WIDTH", str(max_x))
-            page.set("HEIGHT", str(max_y))
-            
-            # Print space (main content area)
-            print_space = ET.SubElement(page, "PrintSpace")
-            print_space.set("HPOS", "0")
-            print_space.set("VPOS", "0")
-            print_space.set("WIDTH", str(max_x))
-            print_space.set("HEIGHT", str(max_y))
-            
-            # Process blocks
-            for block_idx, block in enumerate(ocr_result.get("blocks", [])):
-                text_block = ET.SubElement(print_space, "TextBlock")
-                text_block.set("ID", f"BLOCK_{block_idx + 1}")
-                
-                bbox = block.get("bounding_box", {})
-                text_block.set("HPOS", str(bbox.get("x_min", 0)))
-                text_block.set("VPOS", str(bbox.get("y_min", 0)))
-                text_block.set("WIDTH", str(bbox.get("width", 0)))
-                text_block.set("HEIGHT", str(bbox.get("height", 0)))
-                
-                # Process paragraphs
-                for para_idx, paragraph in enumerate(block.get("paragraphs", [])):
-                    text_line = ET.SubElement(text_block, "TextLine")
-                    text_line.set("ID", f"LINE_{block_idx + 1}_{para_idx + 1}")
-                    
-                    para_bbox = paragraph.get("bounding_box", {})
-                    text_line.set("HPOS", str(para_bbox.get("x_min", 0)))
-                    text_line.set("VPOS", str(para_bbox.get("y_min", 0)))
-                    text_line.set("WIDTH", str(para_bbox.get("width", 0)))
-                    text_line.set("HEIGHT", str(para_bbox.get("height", 0)))
-                    
-                    # Process words
-                    for word_idx, word in enumerate(paragraph.get("words", [])):
-                        string_elem = ET.SubElement(text_line, "String")
-                        string_elem.set("ID", f"WORD_{block_idx + 1}_{para_idx + 1}_{word_idx + 1}")
-                        string_elem.set("CONTENT", word.get("text", ""))
-                        string_elem.set("WC", f"{word.get('confidence', 0.0):.3f}")
-                        
-                        word_bbox = word.get("bounding_box", {})
-                        string_elem.set("HPOS", str(word_bbox.get("x_min", 0)))
-                        string_elem.set("VPOS", str(word_bbox.get("y_min", 0)))
-                        string_elem.set("WIDTH", str(word_bbox.get("width", 0)))
-                        string_elem.set("HEIGHT", str(word_bbox.get("height", 0)))
-                        
-                        # Add space element between words (except last word)
-                        if word_idx < len(paragraph.get("words", [])) - 1:
-                            space_elem = ET.SubElement(text_line, "SP")
-                            space_elem.set("WIDTH", "5")  # Approximate space width
-            
-            # Create output directory if needed
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write ALTO XML with pretty formatting
-            xml_str = ET.tostring(alto_root, encoding='unicode')
-            dom = minidom.parseString(xml_str)
-            pretty_xml = dom.toprettyxml(indent="  ")
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(pretty_xml)
+            # Stream the XML off the event loop
+            await asyncio.get_event_loop().run_in_executor(
+                None, _build_alto, ocr_result, str(output_path), self.alto_namespace
+            )
             
             logger.info(f"✅ ALTO XML generated: {output_path}")
             return output_path
@@ -416,6 +781,40 @@ class GoogleVisionOCRService:
             logger.error(f"❌ Error generating ALTO XML: {e}")
             raise
     
+    def _chunk_images(self, image_paths: List[Path]) -> List[List[Path]]:
+        """
+        Split images into BatchAnnotateImages chunks, capped by image count and
+        by the inline bytes sent (a lone image over the byte cap gets its own chunk)
+        """
+        chunks: List[List[Path]] = []
+        chunk: List[Path] = []
+        chunk_bytes = 0
+        
+        for image_path in image_paths:
+            # GCS images are sent by URI, so they add nothing to the payload
+            if self._gcs_uri(image_path):
+                size = 0
+            else:
+                try:
+                    size = os.path.getsize(image_path)
+                except OSError:
+                    size = 0  # Reported as a failure when the image is read
+            
+            if chunk and (
+                len(chunk) >= self.vision_batch_size
+                or chunk_bytes + size > self.vision_batch_max_bytes
+            ):
+                chunks.append(chunk)
+                chunk = []
+                chunk_bytes = 0
+            
+            chunk.append(image_path)
+            chunk_bytes += size
+        
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+    
     async def batch_process_images(
         self,
         image_paths: List[Path],
@@ -439,34 +838,56 @@ class GoogleVisionOCRService:
             logger.info(f"📚 Starting batch OCR processing: {len(image_paths)} images")
             
             # Create output directory
-            output_dir.mkdir(parents=True, exist_ok=True)
+            await asyncio.get_event_loop().run_in_executor(
+                None, functools.partial(output_dir.mkdir, parents=True, exist_ok=True)
+            )
             
-            results = []
             generate_alto = options.get("generate_alto_xml", True) if options else True
+            total = len(image_paths)
+            completed = 0
             
-            for i, image_path in enumerate(image_paths, 1):
-                logger.info(f"🔍 Processing image {i}/{len(image_paths)}: {image_path.name}")
-                
-                # Process OCR
-                ocr_result = await self.process_image_ocr(image_path, language_hints, options)
+            # Group images into BatchAnnotateImages-sized chunks
+            chunks = await asyncio.get_event_loop().run_in_executor(
+                None, self._chunk_images, image_paths
+            )
+            
+            # Every page in the batch shares the same language hints and timestamp
+            processed_at = datetime.utcnow().isoformat()
+            image_context = self._build_image_context(language_hints) if VISION_AVAILABLE else None
+            
+            # Vision calls are network-bound, so run up to max_concurrency at once
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            
+            async def _process_chunk(chunk: List[Path]) -> List[Dict[str, Any]]:
+                nonlocal completed
                 
-                if ocr_result.get("status") == "success" and generate_alto:
-                    # Generate ALTO XML
-                    alto_filename = f"{image_path.stem}_alto.xml"
-                    alto_path = output_dir / alto_filename
-                    
-                    try:
-                        alto_xml_path = await self.convert_to_alto_xml(ocr_result, alto_path)
-                        ocr_result["alto_xml_path"] = str(alto_xml_path)
-                    except Exception as e:
-                        logger.error(f"❌ Failed to generate ALTO XML for {image_path.name}: {e}")
-                        ocr_result["alto_xml_error"] = str(e)
+                async with semaphore:
+                    # Process OCR
+                    chunk_results = await self._batch_annotate(
+                        chunk, language_hints, options, image_context, processed_at
+                    )
                 
-                results.append(ocr_result)
+                for image_path, ocr_result in zip(chunk, chunk_results):
+                    if ocr_result.get("status") == "success" and generate_alto:
+                        # Generate ALTO XML
+                        alto_filename = f"{image_path.stem}_alto.xml"
+                        alto_path = output_dir / alto_filename
+                        
+                        try:
+                            alto_xml_path = await self.convert_to_alto_xml(ocr_result, alto_path)
+                            ocr_result["alto_xml_path"] = str(alto_xml_path)
+                        except Exception as e:
+                            logger.error(f"❌ Failed to generate ALTO XML for {image_path.name}: {e}")
+                            ocr_result["alto_xml_error"] = str(e)
                 
                 # Progress logging
-                if i % 10 == 0:
-                    logger.info(f"📊 Batch progress: {i}/{len(image_paths)} images processed")
+                completed += len(chunk)
+                logger.info(f"📊 Batch progress: {completed}/{total} images processed")
+                
+                return chunk_results
+            
+            chunk_results = await asyncio.gather(*(_process_chunk(chunk) for chunk in chunks))
+            results = [result for chunk in chunk_results for result in chunk]
             
             logger.info(f"✅ Batch OCR processing completed: {len(results)} images processed")
             return results
@@ -543,7 +964,8 @@ def extract_sanskrit_text_statistics(ocr_results: List[Dict[str, Any]]) -> Dict[
         "devanagari_character_count": 0
     }
     
-    confidences = []
+    confidence_sum = 0.0
+    confidence_count = 0
     
     for result in ocr_results:
         if result.get("status") == "success":
@@ -551,18 +973,18 @@ def extract_sanskrit_text_statistics(ocr_results: List[Dict[str, Any]]) -> Dict[
             stats["total_words"] += result.get("word_count", 0)
             stats["total_characters"] += result.get("character_count", 0)
             
-            if result.get("confidence", 0) > 0:
-                confidences.append(result["confidence"])
+            confidence = result.get("confidence", 0)
+            if confidence > 0:
+                confidence_sum += confidence
+                confidence_count += 1
             
-            # Check for Sanskrit/Devanagari content
-            text = result.get("text", "")
-            if any('\u0900' <= char <= '\u097F' for char in text):
+            # Check for Sanskrit/Devanagari content (one scan both detects and counts)
+            devanagari_count = len(_DEVANAGARI_RE.findall(result.get("text", "")))
+            if devanagari_count:
                 stats["sanskrit_pages"] += 1
-                stats["devanagari_character_count"] += sum(
-                    1 for char in text if '\u0900' <= char <= '\u097F'
-                )
+                stats["devanagari_character_count"] += devanagari_count
     
-    if confidences:
-        stats["average_confidence"] = sum(confidences) / len(confidences)
+    if confidence_count:
+        stats["average_confidence"] = confidence_sum / confidence_count
     
     return stats
@@ -10,24 +10,299 @@ This module provides comprehensive StarDict dictionary import functionality incl
 """
 
 import asyncio
+import collections
+import concurrent.futures
+import functools
+import itertools
 import logging
 import struct
 import gzip
+import mmap
 import os
-from typing import List, Dict, Any, Optional, Tuple, Union
+import uuid
+from typing import AsyncIterator, Iterator, List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime
 from pathlib import Path
 import re
+import sys
+import zlib
+from array import array
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import select
 
 from ..models.proofreading import SanskritGlossaryEntry
-from ..core.database import get_db
+
+# Parallel DEFLATE decoding for gzipped dictionaries
+try:
+    import rapidgzip
+    RAPIDGZIP_AVAILABLE = True
+except ImportError:
+    RAPIDGZIP_AVAILABLE = False
+    logging.warning("rapidgzip not available - gzipped dictionaries decompress on one core")
+
+# Vectorized bounds checks over the .idx offsets
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    logging.warning("numpy not available - definition bounds are checked per entry")
 
 logger = logging.getLogger(__name__)
 
+# .idx entry: null-terminated UTF-8 word, then big-endian 32-bit data offset and size
+_IDX_ENTRY_RE = re.compile(rb'([^\x00]*)\x00(.{8})', re.DOTALL)
+
+# dictzip header fields: little-endian 16-bit lengths, and the "RA" subfield's
+# version, chunk length and chunk count
+_U16LE = struct.Struct('<H')
+_U16LE_TRIPLE = struct.Struct('<HHH')
+
+# ASCII control bytes -> space, applied to raw definitions before decoding. These
+# bytes never occur inside a multi-byte UTF-8 sequence; C1 controls (U+0080-U+009F)
+# are encoded as two bytes and are replaced after decoding instead.
+_ASCII_CONTROLS_TABLE = bytes(
+    0x20 if byte < 0x20 or byte == 0x7f else byte for byte in range(256)
+)
+
+# Definition cleanup and script detection, compiled once (run for every entry)
+_C1_CONTROLS_RE = re.compile(r'[\x80-\x9f]')
+_DEVANAGARI_RE = re.compile(r'[\u0900-\u097F]')
+_IAST_CHARS = frozenset('āīūṛṝḷḹēōṃḥṅñṭḍṇśṣ')
+
+# Definition extraction moves to a process pool above this many index entries;
+# either way entries are decoded off the event loop in runs of _EXTRACT_CHUNK_ENTRIES
+_PARALLEL_EXTRACT_MIN_ENTRIES = 20000
+_EXTRACT_CHUNK_ENTRIES = 5000
+
+# Batches larger than this are written with PostgreSQL COPY instead of ORM inserts
+_COPY_THRESHOLD = 100
+
+# gzip header flags (RFC 1952)
+_GZIP_FHCRC, _GZIP_FEXTRA, _GZIP_FNAME, _GZIP_FCOMMENT = 0x02, 0x04, 0x08, 0x10
+
+
+class DictzipReader:
+    """
+    Random access to a dictzip (.dict.dz) file
+    
+    dictzip compresses the .dict in independent chunks and records their
+    sizes in the gzip "RA" extra field, so a byte range is read by inflating
+    only the chunks that cover it. Supports len() and slicing like the bytes
+    StarDictParser otherwise holds in dict_data.
+    """
+    
+    def __init__(self, data: mmap.mmap, chunk_length: int, chunk_offsets: List[int]):
+        self._data = data
+        self.chunk_length = chunk_length
+        self._chunk_offsets = chunk_offsets  # Start of each chunk, plus end of the last
+        
+        # extract_definitions walks entries in file order, so recent chunks are reused
+        self._inflate_chunk = functools.lru_cache(maxsize=16)(self._inflate_chunk)
+        
+        chunk_count = len(chunk_offsets) - 1
+        self._length = (
+            (chunk_count - 1) * chunk_length + len(self._inflate_chunk(chunk_count - 1))
+            if chunk_count else 0
+        )
+    
+    @classmethod
+    def open(cls, path: str) -> Optional["DictzipReader"]:
+        """
+        Map a dictzip file; returns None if it is a plain gzip file
+        """
+        with open(path, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        try:
+            if data[:3] != b'\x1f\x8b\x08' or not data[3] & _GZIP_FEXTRA:
+                data.close()
+                return None
+            
+            flags = data[3]
+            extra_length, = _U16LE.unpack_from(data, 10)
+            position = 12
+            extra_end = position + extra_length
+            
+            chunk_length = None
+            chunk_sizes = ()
+            while position + 4 <= extra_end:
+                subfield_length, = _U16LE.unpack_from(data, position + 2)
+                if data[position:position + 2] == b'RA':
+                    # Version, chunk length, chunk count, then one size per chunk
+                    _, chunk_length, chunk_count = _U16LE_TRIPLE.unpack_from(data, position + 4)
+                    chunk_sizes = struct.unpack_from(f'<{chunk_count}H', data, position + 10)
+                    break
+                position += 4 + subfield_length
+            
+            if chunk_length is None:
+                data.close()
+                return None
+            
+            # Skip the rest of the header to reach the first chunk
+            position = extra_end
+            if flags & _GZIP_FNAME:
+                position = data.find(b'\x00', position) + 1
+            if flags & _GZIP_FCOMMENT:
+                position = data.find(b'\x00', position) + 1
+            if flags & _GZIP_FHCRC:
+                position += 2
+            
+            chunk_offsets = [position]
+            for size in chunk_sizes:
+                chunk_offsets.append(chunk_offsets[-1] + size)
+            
+            return cls(data, chunk_length, chunk_offsets)
+            
+        except Exception:
+            data.close()
+            raise
+    
+    def _inflate_chunk(self, index: int) -> bytes:
+        return zlib.decompressobj(-zlib.MAX_WBITS).decompress(
+            self._data[self._chunk_offsets[index]:self._chunk_offsets[index + 1]]
+        )
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __getitem__(self, key: slice) -> bytes:
+        start, stop, _ = key.indices(self._length)
+        if start >= stop:
+            return b""
+        
+        first, last = start // self.chunk_length, (stop - 1) // self.chunk_length
+        data = b"".join(self._inflate_chunk(index) for index in range(first, last + 1))
+        base = first * self.chunk_length
+        return data[start - base:stop - base]
+    
+    def close(self):
+        self._inflate_chunk.cache_clear()
+        self._data.close()
+
+
+def _parse_definition_data(data: bytes) -> str:
+    """
+    Parse definition data based on StarDict format
+    """
+    try:
+        # Replace null bytes and control characters in one table lookup pass,
+        # then decode as UTF-8 text
+        definition = data.translate(_ASCII_CONTROLS_TABLE).decode('utf-8', errors='ignore')
+        if not definition.isascii():
+            definition = _C1_CONTROLS_RE.sub(' ', definition)
+        
+        # Normalize whitespace (split() also strips the ends)
+        return ' '.join(definition.split())
+        
+    except Exception as e:
+        logger.warning(f"⚠️ Error parsing definition data: {e}")
+        return data.decode('utf-8', errors='replace')
+
+
+def _analyze_word(word: str) -> Dict[str, Any]:
+    """
+    Analyze word to extract linguistic information
+    """
+    word_info = {}
+    
+    # Detect script (pure-ASCII words can only be romanized; isascii() is O(1))
+    is_ascii = word.isascii()
+    if not is_ascii and _DEVANAGARI_RE.search(word):
+        # Devanagari script
+        word_info['devanagari'] = word
+        word_info['script'] = 'devanagari'
+    elif not is_ascii and not _IAST_CHARS.isdisjoint(word):
+        # IAST transliteration
+        word_info['iast'] = word
+        word_info['script'] = 'iast'
+    else:
+        # Romanized or other
+        word_info['romanized'] = word
+        word_info['script'] = 'romanized'
+    
+    # Extract basic grammatical information (simplified)
+    word_lower = word.lower()
+    
+    # Gender detection (basic patterns)
+    if word_lower.endswith(('ा', 'a')):
+        word_info['gender'] = 'masculine'
+    elif word_lower.endswith(('ी', 'ī', 'i')):
+        word_info['gender'] = 'feminine'
+    elif word_lower.endswith(('म्', 'am', 'um')):
+        word_info['gender'] = 'neuter'
+    
+    return word_info
+
+
+def _iter_entries(
+    dict_data: Union[bytes, mmap.mmap, "DictzipReader"],
+    words: List[str],
+    offsets: array,
+    sizes: array,
+    source_dict: str
+) -> Iterator[Dict[str, Any]]:
+    """
+    Decode and clean the definitions for a run of (in-bounds) index entries
+    """
+    for word, offset, size in zip(words, offsets, sizes):
+        try:
+            # Extract definition data
+            definition_data = dict_data[offset:offset + size]
+            
+            # Parse definition based on data type
+            definition = _parse_definition_data(definition_data)
+            
+            # Create entry
+            entry = {
+                'word': word,
+                'definition': definition,
+                'source_dict': source_dict
+            }
+            
+            yield entry
+            
+        except Exception as e:
+            logger.warning(f"⚠️ Error processing word '{word}': {e}")
+            continue
+
+
+def _extract_entries(
+    dict_data: Union[bytes, mmap.mmap, "DictzipReader"],
+    words: List[str],
+    offsets: array,
+    sizes: array,
+    source_dict: str
+) -> List[Dict[str, Any]]:
+    """
+    Extract a run of entries in one call, for running off the event loop
+    """
+    return list(_iter_entries(dict_data, words, offsets, sizes, source_dict))
+
+
+def _extract_entries_from_file(
+    dict_path: str,
+    words: List[str],
+    offsets: array,
+    sizes: array,
+    source_dict: str
+) -> List[Dict[str, Any]]:
+    """
+    Process pool worker: open the .dict itself (mmap or dictzip), so the data
+    is never pickled across, and extract its share of the entries
+    """
+    if dict_path.endswith(('.gz', '.dz')):
+        dict_data = DictzipReader.open(dict_path)
+    else:
+        with open(dict_path, 'rb') as f:
+            dict_data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    try:
+        return _extract_entries(dict_data, words, offsets, sizes, source_dict)
+    finally:
+        dict_data.close()
+
 
 class StarDictParser:
     """
@@ -37,8 +312,13 @@ class StarDictParser:
     
     def __init__(self):
         self.info_data = {}
-        self.index_data = []
+        # Index as parallel arrays (no tuple per entry); offsets and sizes are
+        # packed unsigned 32-bit ints rather than boxed Python ints
+        self.idx_words: List[str] = []
+        self.idx_offsets = array('I')
+        self.idx_sizes = array('I')
         self.dict_data = b""
+        self.dict_path: Optional[str] = None
         self.entries = []
     
     def parse_ifo_file(self, ifo_path: str) -> Dict[str, Any]:
@@ -82,54 +362,47 @@ class StarDictParser:
             logger.error(f"❌ Error parsing .ifo file: {e}")
             raise
     
-    def parse_idx_file(self, idx_path: str) -> List[Tuple[str, int, int]]:
+    def parse_idx_file(self, idx_path: str) -> Tuple[List[str], array, array]:
         """
         Parse StarDict .idx (index) file
-        Contains word list with offsets and lengths
+        Contains word list with offsets and lengths, returned as parallel arrays
         """
         try:
             logger.info(f"📇 Parsing StarDict .idx file: {idx_path}")
             
-            index_data = []
-            
             # Check if file is compressed
             is_compressed = idx_path.endswith('.gz')
             
             if is_compressed:
-                with gzip.open(idx_path, 'rb') as f:
-                    data = f.read()
+                data = self._read_gzip(idx_path)
             else:
-                with open(idx_path, 'rb') as f:
-                    data = f.read()
-            
-            offset = 0
-            while offset < len(data):
-                # Find null terminator for word
-                null_pos = data.find(b'\x00', offset)
-                if null_pos == -1:
-                    break
-                
-                # Extract word
-                word = data[offset:null_pos].decode('utf-8')
-                
-                # Extract data offset and size (8 bytes total)
-                if null_pos + 8 >= len(data):
-                    break
-                
-                data_offset, data_size = struct.unpack('>II', data[null_pos + 1:null_pos + 9])
-                
-                index_data.append((word, data_offset, data_size))
-                offset = null_pos + 9
+                data = self._map_file(idx_path)
             
-            self.index_data = index_data
-            logger.info(f"✅ Parsed .idx file: {len(index_data)} entries")
-            return index_data
+            # One C-level scan splits every entry into (word, 8-byte trailer); a
+            # truncated final entry simply doesn't match
+            found = _IDX_ENTRY_RE.findall(data)
+            
+            if isinstance(data, mmap.mmap):
+                data.close()
+            
+            # Words are stripped once here; definitions are stripped when cleaned
+            words = [str(word, 'utf-8').strip() for word, _ in found]
+            
+            # Trailers are big-endian (offset, size) pairs: convert them all at once
+            pairs = array('I', b''.join([trailer for _, trailer in found]))
+            if sys.byteorder == 'little':
+                pairs.byteswap()
+            offsets, sizes = pairs[0::2], pairs[1::2]
+            
+            self.idx_words, self.idx_offsets, self.idx_sizes = words, offsets, sizes
+            logger.info(f"✅ Parsed .idx file: {len(words)} entries")
+            return words, offsets, sizes
             
         except Exception as e:
             logger.error(f"❌ Error parsing .idx file: {e}")
             raise
     
-    def parse_dict_file(self, dict_path: str) -> bytes:
+    def parse_dict_file(self, dict_path: str) -> Union[bytes, mmap.mmap, DictzipReader]:
         """
         Parse StarDict .dict (data) file
         Contains the actual dictionary definitions
@@ -138,16 +411,19 @@ class StarDictParser:
             logger.info(f"📚 Parsing StarDict .dict file: {dict_path}")
             
             # Check if file is compressed
-            is_compressed = dict_path.endswith('.gz')
+            is_compressed = dict_path.endswith(('.gz', '.dz'))
+            
+            self.close()
             
             if is_compressed:
-                with gzip.open(dict_path, 'rb') as f:
-                    dict_data = f.read()
+                # dictzip chunks are inflated on demand; plain gzip is decompressed whole
+                dict_data = DictzipReader.open(dict_path) or self._read_gzip(dict_path)
             else:
-                with open(dict_path, 'rb') as f:
-                    dict_data = f.read()
+                # Definitions are paged in from disk as extract_definitions slices them
+                dict_data = self._map_file(dict_path)
             
             self.dict_data = dict_data
+            self.dict_path = dict_path
             logger.info(f"✅ Parsed .dict file: {len(dict_data)} bytes")
             return dict_data
             
@@ -155,43 +431,148 @@ class StarDictParser:
             logger.error(f"❌ Error parsing .dict file: {e}")
             raise
     
+    def _read_gzip(self, path: str) -> bytes:
+        """
+        Decompress a gzipped file, across all cores when rapidgzip is installed
+        """
+        if RAPIDGZIP_AVAILABLE:
+            with rapidgzip.open(path, parallelization=os.cpu_count()) as f:
+                return f.read()
+        
+        with gzip.open(path, 'rb') as f:
+            return f.read()
+    
+    def _map_file(self, path: str) -> Union[mmap.mmap, bytes]:
+        """
+        Map an uncompressed file read-only (empty files can't be mapped)
+        """
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b""
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    def close(self):
+        """
+        Release the memory-mapped or dictzip .dict file, if any
+        """
+        if isinstance(self.dict_data, (mmap.mmap, DictzipReader)):
+            self.dict_data.close()
+        self.dict_data = b""
+        self.dict_path = None
+    
+    def _extraction_plan(self) -> Tuple[List[str], array, array, str]:
+        """
+        Select the in-bounds index entries to extract
+        
+        Returns:
+            (words, offsets, sizes, source_dict) for the entries that fit in the .dict data
+        """
+        logger.info("🔍 Extracting definitions from StarDict data")
+        
+        if not self.idx_words or not self.dict_data:
+            raise ValueError("Index or dictionary data not loaded")
+        
+        words, offsets, sizes = self._select_in_bounds()
+        # One shared string for every entry's source_dict
+        source_dict = sys.intern(self.info_data.get('bookname', 'Unknown'))
+        
+        return words, offsets, sizes, source_dict
+    
+    def iter_definitions(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield word definitions from parsed StarDict data, one entry at a time
+        
+        Nothing is accumulated here, so a consumer that batches entries keeps
+        memory at O(batch) rather than O(word count).
+        """
+        words, offsets, sizes, source_dict = self._extraction_plan()
+        yield from _iter_entries(self.dict_data, words, offsets, sizes, source_dict)
+    
+    async def aiter_definitions(
+        self,
+        executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield word definitions without blocking the event loop
+        
+        Runs of entries are decoded off the loop: in the given process pool
+        for large mapped/dictzip dictionaries, otherwise in a worker thread.
+        """
+        words, offsets, sizes, source_dict = self._extraction_plan()
+        
+        # Workers re-open the file themselves, so only mapped/dictzip data qualifies
+        if (
+            executor is not None
+            and len(words) >= _PARALLEL_EXTRACT_MIN_ENTRIES
+            and isinstance(self.dict_data, (mmap.mmap, DictzipReader))
+        ):
+            async for entry in self._aiter_definitions_parallel(
+                executor, words, offsets, sizes, source_dict
+            ):
+                yield entry
+            return
+        
+        for start in range(0, len(words), _EXTRACT_CHUNK_ENTRIES):
+            stop = start + _EXTRACT_CHUNK_ENTRIES
+            entries = await asyncio.to_thread(
+                _extract_entries,
+                self.dict_data,
+                words[start:stop],
+                offsets[start:stop],
+                sizes[start:stop],
+                source_dict
+            )
+            for entry in entries:
+                yield entry
+    
+    async def _aiter_definitions_parallel(
+        self,
+        executor: concurrent.futures.ProcessPoolExecutor,
+        words: List[str],
+        offsets: array,
+        sizes: array,
+        source_dict: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Extract runs of entries in a process pool, yielding them in index order
+        
+        At most two runs per worker are in flight, so a slow consumer (e.g. the
+        database import) bounds how far extraction gets ahead of it.
+        """
+        loop = asyncio.get_running_loop()
+        window = (os.cpu_count() or 1) * 2
+        pending = collections.deque()
+        
+        try:
+            for start in range(0, len(words), _EXTRACT_CHUNK_ENTRIES):
+                stop = start + _EXTRACT_CHUNK_ENTRIES
+                pending.append(loop.run_in_executor(
+                    executor,
+                    _extract_entries_from_file,
+                    self.dict_path,
+                    words[start:stop],
+                    offsets[start:stop],
+                    sizes[start:stop],
+                    source_dict
+                ))
+                if len(pending) >= window:
+                    for entry in await pending.popleft():
+                        yield entry
+            
+            while pending:
+                for entry in await pending.popleft():
+                    yield entry
+        finally:
+            # Abandoned early (error or cancellation): don't leave runs queued in the pool
+            for future in pending:
+                future.cancel()
+    
     def extract_definitions(self) -> List[Dict[str, Any]]:
         """
         Extract word definitions from parsed StarDict data
         """
         try:
-            logger.info("🔍 Extracting definitions from StarDict data")
-            
-            if not self.index_data or not self.dict_data:
-                raise ValueError("Index or dictionary data not loaded")
-            
-            entries = []
-            
-            for word, offset, size in self.index_data:
-                try:
-                    # Extract definition data
-                    if offset + size > len(self.dict_data):
-                        logger.warning(f"⚠️ Definition data out of bounds for word: {word}")
-                        continue
-                    
-                    definition_data = self.dict_data[offset:offset + size]
-                    
-                    # Parse definition based on data type
-                    definition = self._parse_definition_data(definition_data)
-                    
-                    # Create entry
-                    entry = {
-                        'word': word,
-                        'definition': definition,
-                        'source_dict': self.info_data.get('bookname', 'Unknown'),
-                        'raw_data': definition_data
-                    }
-                    
-                    entries.append(entry)
-                    
-                except Exception as e:
-                    logger.warning(f"⚠️ Error processing word '{word}': {e}")
-                    continue
+            entries = list(self.iter_definitions())
             
             self.entries = entries
             logger.info(f"✅ Extracted {len(entries)} definitions")
@@ -201,34 +582,64 @@ class StarDictParser:
             logger.error(f"❌ Error extracting definitions: {e}")
             raise
     
-    def _parse_definition_data(self, data: bytes) -> str:
+    def _select_in_bounds(self) -> Tuple[List[str], array, array]:
         """
-        Parse definition data based on StarDict format
+        Keep the index entries that lie entirely within the .dict data,
+        logging the ones that don't
         """
-        try:
-            # Try to decode as UTF-8 text first
-            definition = data.decode('utf-8', errors='ignore')
-            
-            # Clean up the definition
-            definition = definition.strip()
-            
-            # Remove null bytes and control characters
-            definition = re.sub(r'[\x00-\x1f\x7f-\x9f]', ' ', definition)
-            
-            # Normalize whitespace
-            definition = re.sub(r'\s+', ' ', definition)
-            
-            return definition
-            
-        except Exception as e:
-            logger.warning(f"⚠️ Error parsing definition data: {e}")
-            return data.decode('utf-8', errors='replace')
+        dict_length = len(self.dict_data)
+        
+        if NUMPY_AVAILABLE:
+            # One vectorized comparison; uint64 so offset + size can't overflow
+            offsets = np.frombuffer(self.idx_offsets, dtype=np.uintc)
+            sizes = np.frombuffer(self.idx_sizes, dtype=np.uintc)
+            in_bounds = offsets.astype(np.uint64) + sizes <= dict_length
+            out_of_bounds = np.flatnonzero(~in_bounds)
+            
+            if not out_of_bounds.size:
+                return self.idx_words, self.idx_offsets, self.idx_sizes
+            
+            for index in out_of_bounds.tolist():
+                logger.warning(f"⚠️ Definition data out of bounds for word: {self.idx_words[index]}")
+            
+            words = list(itertools.compress(self.idx_words, in_bounds.tolist()))
+            kept_offsets = array('I')
+            kept_offsets.frombytes(offsets[in_bounds].tobytes())
+            kept_sizes = array('I')
+            kept_sizes.frombytes(sizes[in_bounds].tobytes())
+            return words, kept_offsets, kept_sizes
+        
+        words = []
+        kept_offsets = array('I')
+        kept_sizes = array('I')
+        for word, offset, size in zip(self.idx_words, self.idx_offsets, self.idx_sizes):
+            if offset + size <= dict_length:
+                words.append(word)
+                kept_offsets.append(offset)
+                kept_sizes.append(size)
+            else:
+                logger.warning(f"⚠️ Definition data out of bounds for word: {word}")
+        return words, kept_offsets, kept_sizes
     
     def parse_stardict_files(self, base_path: str) -> List[Dict[str, Any]]:
         """
         Parse complete StarDict dictionary from base path
         Automatically finds .ifo, .idx, and .dict files
         """
+        self.load_stardict_files(base_path)
+        
+        # Extract definitions
+        entries = self.extract_definitions()
+        
+        logger.info(f"✅ Successfully parsed StarDict dictionary: {len(entries)} entries")
+        return entries
+    
+    def load_stardict_files(self, base_path: str) -> Dict[str, Any]:
+        """
+        Find and parse the .ifo, .idx, and .dict files under base path
+        
+        Definitions are not extracted; use iter_definitions() to stream them.
+        """
         try:
             logger.info(f"📖 Parsing StarDict dictionary from: {base_path}")
             
@@ -260,6 +671,8 @@ class StarDictParser:
             # Check for compressed versions
             if not idx_file.exists():
                 idx_file = base_dir / f"{base_name}.idx.gz"
+            if not dict_file.exists():
+                dict_file = base_dir / f"{base_name}.dict.dz"
             if not dict_file.exists():
                 dict_file = base_dir / f"{base_name}.dict.gz"
             
@@ -276,11 +689,7 @@ class StarDictParser:
             self.parse_idx_file(str(idx_file))
             self.parse_dict_file(str(dict_file))
             
-            # Extract definitions
-            entries = self.extract_definitions()
-            
-            logger.info(f"✅ Successfully parsed StarDict dictionary: {len(entries)} entries")
-            return entries
+            return self.info_data
             
         except Exception as e:
             logger.error(f"❌ Error parsing StarDict files: {e}")
@@ -294,6 +703,24 @@ class StarDictImportService:
     
     def __init__(self):
         self.parser = StarDictParser()
+        self._extract_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+    
+    def _get_extract_pool(self) -> Optional[concurrent.futures.ProcessPoolExecutor]:
+        """
+        Process pool for decoding large dictionaries, created on first use and
+        kept for the life of the app (None on a single-CPU host)
+        """
+        if self._extract_pool is None and (os.cpu_count() or 1) > 1:
+            self._extract_pool = concurrent.futures.ProcessPoolExecutor()
+        return self._extract_pool
+    
+    def close(self):
+        """
+        Shut down the extraction process pool, if it was started
+        """
+        if self._extract_pool is not None:
+            self._extract_pool.shutdown(wait=True, cancel_futures=True)
+            self._extract_pool = None
     
     async def import_stardict_dictionary(
         self,
@@ -301,67 +728,79 @@ class StarDictImportService:
         db: AsyncSession,
         language: str = "sanskrit",
         context: str = "imported",
-        batch_size: int = 100,
+        batch_size: int = 5000,
         validate_entries: bool = True,
         deduplicate: bool = True
     ) -> Dict[str, Any]:
         """
         Import StarDict dictionary into Sanskrit glossary
         """
+        definitions = None
         try:
             logger.info(f"📚 Starting StarDict import from: {dict_path}")
             
-            # Parse StarDict files
-            entries = self.parser.parse_stardict_files(dict_path)
-            
-            if not entries:
-                raise ValueError("No entries found in StarDict dictionary")
-            
-            # Process entries for import
-            processed_entries = []
-            skipped_entries = []
+            # Parse StarDict files; definitions are streamed into batches as they are
+            # extracted, so only one batch is held in memory at a time
+            self.parser.load_stardict_files(dict_path)
+            
+            # With deduplicate, words already in the glossary before this import
+            # are skipped by the database as each batch is inserted
+            imported_at = datetime.utcnow()
+            source = sys.intern(self.parser.info_data.get('bookname', 'Unknown'))
+            total_entries = 0
+            processed_count = 0
+            skipped_count = 0
+            imported_count = 0
+            failed_count = 0
+            batch_number = 0
+            batch = []
             
-            for entry in entries:
+            definitions = self.parser.aiter_definitions(self._get_extract_pool())
+            async for entry in definitions:
+                total_entries += 1
                 try:
                     processed_entry = await self._process_entry_for_import(
-                        entry, language, context, validate_entries
+                        entry, language, context, validate_entries, source
                     )
                     if processed_entry:
-                        processed_entries.append(processed_entry)
+                        batch.append(processed_entry)
+                        processed_count += 1
                     else:
-                        skipped_entries.append(entry['word'])
+                        skipped_count += 1
                 except Exception as e:
                     logger.warning(f"⚠️ Skipping entry '{entry['word']}': {e}")
-                    skipped_entries.append(entry['word'])
-            
-            logger.info(f"📊 Processed {len(processed_entries)} entries, skipped {len(skipped_entries)}")
-            
-            # Deduplicate if requested
-            if deduplicate:
-                processed_entries = await self._deduplicate_entries(processed_entries, db)
+                    skipped_count += 1
+                
+                if len(batch) >= batch_size:
+                    batch_number += 1
+                    imported, failed = await self._import_batch_counted(
+                        batch, batch_number, db, imported_at, deduplicate
+                    )
+                    imported_count += imported
+                    failed_count += failed
+                    batch = []
+            
+            if batch:
+                batch_number += 1
+                imported, failed = await self._import_batch_counted(
+                    batch, batch_number, db, imported_at, deduplicate
+                )
+                imported_count += imported
+                failed_count += failed
             
-            # Import in batches
-            imported_count = 0
-            failed_count = 0
+            if not total_entries:
+                raise ValueError("No entries found in StarDict dictionary")
             
-            for i in range(0, len(processed_entries), batch_size):
-                batch = processed_entries[i:i + batch_size]
-                try:
-                    batch_imported = await self._import_batch(batch, db)
-                    imported_count += batch_imported
-                    logger.info(f"✅ Imported batch {i//batch_size + 1}: {batch_imported} entries")
-                except Exception as e:
-                    logger.error(f"❌ Failed to import batch {i//batch_size + 1}: {e}")
-                    failed_count += len(batch)
+            logger.info(f"📊 Processed {processed_count} entries, skipped {skipped_count}")
             
             # Prepare import summary
             import_summary = {
                 "dictionary_name": self.parser.info_data.get('bookname', 'Unknown'),
                 "source_path": dict_path,
-                "total_entries": len(entries),
-                "processed_entries": len(processed_entries),
+                "total_entries": total_entries,
+                "processed_entries": processed_count,
                 "imported_entries": imported_count,
-                "skipped_entries": len(skipped_entries),
+                "skipped_entries": skipped_count,
                 "failed_entries": failed_count,
                 "language": language,
                 "context": context,
@@ -375,20 +814,29 @@ class StarDictImportService:
         except Exception as e:
             logger.error(f"❌ StarDict import failed: {e}")
             raise
+        finally:
+            # Extraction is finished (or abandoned): cancel queued runs, then the
+            # mapped .dict file can go
+            if definitions is not None:
+                await definitions.aclose()
+            self.parser.close()
     
     async def _process_entry_for_import(
         self,
         entry: Dict[str, Any],
         language: str,
         context: str,
-        validate: bool
+        validate: bool,
+        source: str
     ) -> Optional[Dict[str, Any]]:
         """
         Process a StarDict entry for import into glossary
+        
+        source is the dictionary name, looked up once by the caller.
         """
         try:
-            word = entry['word'].strip()
-            definition = entry['definition'].strip()
+            word = entry['word']
+            definition = entry['definition']
             
             if not word or not definition:
                 return None
@@ -400,7 +848,7 @@ class StarDictImportService:
                     return None
             
             # Detect script and extract linguistic information
-            word_info = self._analyze_word(word)
+            word_info = _analyze_word(word)
             
             # Create glossary entry
             glossary_entry = {
@@ -412,7 +860,7 @@ class StarDictImportService:
                 'part_of_speech': word_info.get('pos'),
                 'gender': word_info.get('gender'),
                 'context': context,
-                'source': entry.get('source_dict', 'StarDict Import'),
+                'source': source,
                 'frequency': 1,
                 'is_verified': False
             }
@@ -423,112 +871,121 @@ class StarDictImportService:
             logger.warning(f"⚠️ Error processing entry: {e}")
             return None
     
-    def _analyze_word(self, word: str) -> Dict[str, Any]:
-        """
-        Analyze word to extract linguistic information
-        """
-        word_info = {}
-        
-        # Detect script
-        if re.search(r'[\u0900-\u097F]', word):
-            # Devanagari script
-            word_info['devanagari'] = word
-            word_info['script'] = 'devanagari'
-        elif re.search(r'[āīūṛṝḷḹēōṃḥṅñṭḍṇśṣ]', word):
-            # IAST transliteration
-            word_info['iast'] = word
-            word_info['script'] = 'iast'
-        else:
-            # Romanized or other
-            word_info['romanized'] = word
-            word_info['script'] = 'romanized'
-        
-        # Extract basic grammatical information (simplified)
-        word_lower = word.lower()
-        
-        # Gender detection (basic patterns)
-        if word_lower.endswith(('ा', 'a')):
-            word_info['gender'] = 'masculine'
-        elif word_lower.endswith(('ी', 'ī', 'i')):
-            word_info['gender'] = 'feminine'
-        elif word_lower.endswith(('म्', 'am', 'um')):
-            word_info['gender'] = 'neuter'
-        
-        return word_info
-    
-    async def _deduplicate_entries(
+    async def _import_batch_counted(
         self,
-        entries: List[Dict[str, Any]],
-        db: AsyncSession
-    ) -> List[Dict[str, Any]]:
+        batch: List[Dict[str, Any]],
+        batch_number: int,
+        db: AsyncSession,
+        imported_at: datetime,
+        deduplicate: bool
+    ) -> Tuple[int, int]:
         """
-        Remove duplicate entries based on existing glossary
+        Import one batch, logging the outcome
+        
+        Returns:
+            (entries imported, entries failed); a failed batch doesn't stop the import
         """
         try:
-            logger.info(f"🔍 Deduplicating {len(entries)} entries")
-            
-            # Get existing words from database
-            existing_words = set()
-            
-            # Check Devanagari words
-            devanagari_words = [e['word_devanagari'] for e in entries if e['word_devanagari']]
-            if devanagari_words:
-                query = select(SanskritGlossaryEntry.word_devanagari).where(
-                    SanskritGlossaryEntry.word_devanagari.in_(devanagari_words)
-                )
-                result = await db.execute(query)
-                existing_words.update(result.scalars().all())
-            
-            # Check IAST words
-            iast_words = [e['word_iast'] for e in entries if e['word_iast']]
-            if iast_words:
-                query = select(SanskritGlossaryEntry.word_iast).where(
-                    SanskritGlossaryEntry.word_iast.in_(iast_words)
-                )
-                result = await db.execute(query)
-                existing_words.update(result.scalars().all())
-            
-            # Filter out duplicates
-            unique_entries = []
-            for entry in entries:
-                if (entry['word_devanagari'] not in existing_words and 
-                    entry['word_iast'] not in existing_words):
-                    unique_entries.append(entry)
-            
-            logger.info(f"✅ Deduplicated: {len(unique_entries)} unique entries")
-            return unique_entries
-            
+            batch_imported = await self._import_batch(batch, db, imported_at, deduplicate)
+            logger.info(f"✅ Imported batch {batch_number}: {batch_imported} entries")
+            return batch_imported, 0
         except Exception as e:
-            logger.error(f"❌ Error deduplicating entries: {e}")
-            return entries
+            logger.error(f"❌ Failed to import batch {batch_number}: {e}")
+            return 0, len(batch)
     
     async def _import_batch(
         self,
         entries: List[Dict[str, Any]],
-        db: AsyncSession
+        db: AsyncSession,
+        imported_at: datetime,
+        deduplicate: bool = False
     ) -> int:
         """
         Import a batch of entries into the database
+        
+        Returns:
+            Number of entries inserted (duplicates of existing words are not counted)
         """
         try:
-            # Prepare entries for bulk insert
-            glossary_entries = []
-            
-            for entry in entries:
-                glossary_entry = SanskritGlossaryEntry(**entry)
-                glossary_entries.append(glossary_entry)
-            
-            # Bulk insert
-            db.add_all(glossary_entries)
+            if deduplicate or len(entries) > _COPY_THRESHOLD:
+                imported = await self._copy_batch(entries, db, imported_at, deduplicate)
+            else:
+                # Core executemany insert: column defaults (id, timestamps) still apply,
+                # without building an ORM object per entry
+                await db.execute(SanskritGlossaryEntry.__table__.insert(), entries)
+                imported = len(entries)
             await db.commit()
             
-            return len(glossary_entries)
+            return imported
             
         except Exception as e:
             await db.rollback()
             logger.error(f"❌ Error importing batch: {e}")
             raise
     
+    async def _copy_batch(
+        self,
+        entries: List[Dict[str, Any]],
+        db: AsyncSession,
+        imported_at: datetime,
+        deduplicate: bool
+    ) -> int:
+        """
+        Write a batch with asyncpg's COPY, inside the session's transaction
+        
+        COPY bypasses the ORM, so the column defaults (id, timestamps) are filled
+        here, stamped with the import's start time. With deduplicate, rows are
+        staged in a temporary table and only words not already in the glossary
+        before this import are inserted, in one statement on the server. That
+        lookup is served by the word_devanagari / word_iast indexes, so nothing
+        about existing words is fetched or cached client-side across imports.
+        """
+        table = SanskritGlossaryEntry.__tablename__
+        fields = list(entries[0])
+        columns = ['id', *fields, 'last_used', 'created_at', 'updated_at']
+        records = [
+            (uuid.uuid4(), *(entry[field] for field in fields), imported_at, imported_at, imported_at)
+            for entry in entries
+        ]
+        
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        
+        # Becomes a savepoint if the session already started a transaction
+        async with driver_connection.transaction():
+            if not deduplicate:
+                await driver_connection.copy_records_to_table(table, records=records, columns=columns)
+                return len(records)
+            
+            await driver_connection.execute(
+                f"CREATE TEMP TABLE glossary_import (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            await driver_connection.copy_records_to_table(
+                'glossary_import', records=records, columns=columns
+            )
+            
+            column_list = ', '.join(columns)
+            status = await driver_connection.execute(
+                f"""
+                INSERT INTO {table} ({column_list})
+                SELECT {column_list} FROM glossary_import staged
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM {table} existing
+                    WHERE existing.created_at < $1
+                    AND (
+                        existing.word_devanagari = staged.word_devanagari
+                        OR (staged.word_iast <> '' AND existing.word_iast = staged.word_iast)
+                    )
+                )
+                """,
+                imported_at
+            )
+            await driver_connection.execute("DROP TABLE glossary_import")
+            
+            # Command status is "INSERT 0 <rows>"
+            return int(status.rsplit(' ', 1)[-1])
+    
     async def list_imported_dictionaries(self, db: AsyncSession) -> List[Dict[str, Any]]:
         """
         List all imported dictionaries with statistics
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Search Index Consumer for Vāṇmayam
+
+Reads documents queued on the Kafka index topic (KAFKA_INDEX_TOPIC) and bulk
+indexes them into Elasticsearch. Run alongside the API when Kafka-backed
+indexing is enabled.
+"""
+
+import asyncio
+import logging
+
+from app.services.search_service import search_service
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def main():
+    """
+    Initialize the search service and consume until interrupted
+    """
+    await search_service.initialize()
+    try:
+        await search_service.run_index_consumer()
+    finally:
+        await search_service.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        logger.info("🙏 Index consumer stopped")